@@ -5,17 +5,40 @@ Comprehensive analysis and visualization of model performance, memory requiremen
 
 import warnings
 import matplotlib.pyplot as plt
+from matplotlib.transforms import offset_copy
 import seaborn as sns
 import pandas as pd
 import numpy as np
+import hashlib
 import json
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to the plain Python kernel
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+_MPL_READY = False
 
 def setup_matplotlib_for_plotting():
     """
     Setup matplotlib and seaborn for plotting with proper configuration.
     Call this function before creating any plots to ensure proper rendering.
     """
+    global _MPL_READY
+    if _MPL_READY:
+        return
+
     warnings.filterwarnings('default')  # Show all warnings
 
     # Configure matplotlib for non-interactive mode
@@ -29,274 +52,272 @@ def setup_matplotlib_for_plotting():
     plt.rcParams["font.sans-serif"] = ["Noto Sans CJK SC", "WenQuanYi Zen Hei", "PingFang SC", "Arial Unicode MS", "Hiragino Sans GB"]
     plt.rcParams["axes.unicode_minus"] = False
 
-# Setup matplotlib
-setup_matplotlib_for_plotting()
+    # Speed up Agg rendering: simplify paths, chunk long paths, skip text hinting
+    plt.rcParams.update({
+        "path.simplify": True,
+        "path.simplify_threshold": 1.0,
+        "agg.path.chunksize": 10000,
+        "text.hinting": "none",
+    })
 
-def create_webllm_compatibility_data():
-    """Create comprehensive model compatibility and performance data"""
-    
-    # WebLLM supported models with memory requirements
-    webllm_models = {
-        'Llama-3.2-1B-Instruct-q4f16_1': {
-            'vram_mb': 879.04,
-            'parameters': '1.23B',
-            'low_resource_compatible': True,
-            'context_window': 4096,
-            'quantization': 'q4f16_1',
-            'sentiment_f1_score': None,  # Not directly tested
-            'instruction_following': 59.5,  # IFEval from Llama data
-            'file_size_gb': 0.88
-        },
-        'Llama-3.2-1B-Instruct-q4f32_1': {
-            'vram_mb': 1128.82,
-            'parameters': '1.23B',
-            'low_resource_compatible': True,
-            'context_window': 4096,
-            'quantization': 'q4f32_1',
-            'sentiment_f1_score': None,
-            'instruction_following': 59.5,
-            'file_size_gb': 1.13
-        },
-        'Llama-3.2-3B-Instruct-q4f16_1': {
-            'vram_mb': 2263.69,
-            'parameters': '3.21B',
-            'low_resource_compatible': True,
-            'context_window': 4096,
-            'quantization': 'q4f16_1',
-            'sentiment_f1_score': None,
-            'instruction_following': 59.5,  # Estimated similar to 1B
-            'file_size_gb': 2.26
-        },
-        'SmolLM2-135M-Instruct-q0f32': {
-            'vram_mb': 719.38,
-            'parameters': '135M',
-            'low_resource_compatible': True,
-            'context_window': 4096,
-            'quantization': 'q0f32',
-            'sentiment_f1_score': None,  # Not tested in benchmarks
-            'instruction_following': None,
-            'file_size_gb': 0.72
-        },
-        'SmolLM2-360M-Instruct-q4f32_1': {
-            'vram_mb': 579.61,
-            'parameters': '360M',
-            'low_resource_compatible': True,
-            'context_window': 4096,
-            'quantization': 'q4f32_1',
-            'sentiment_f1_score': None,
-            'instruction_following': None,
-            'file_size_gb': 0.58
-        },
-        'SmolLM2-1.7B-Instruct-q4f32_1': {
-            'vram_mb': 2692.38,
-            'parameters': '1.7B',
-            'low_resource_compatible': True,
-            'context_window': 4096,
-            'quantization': 'q4f32_1',
-            'sentiment_f1_score': None,
-            'instruction_following': None,
-            'file_size_gb': 2.69
-        },
-        'Phi-3.5-mini-instruct-q4f16_1': {
-            'vram_mb': 3672.07,
-            'parameters': '3.8B',
-            'low_resource_compatible': False,
-            'context_window': 4096,
-            'quantization': 'q4f16_1',
-            'sentiment_f1_score': None,
-            'instruction_following': 61.4,  # Overall average from benchmarks
-            'file_size_gb': 3.67
-        },
-        'Phi-3.5-mini-instruct-q4f16_1-1k': {
-            'vram_mb': 2520.07,
-            'parameters': '3.8B',
-            'low_resource_compatible': True,
-            'context_window': 1024,
-            'quantization': 'q4f16_1',
-            'sentiment_f1_score': None,
-            'instruction_following': 61.4,
-            'file_size_gb': 2.52
-        },
-        'Qwen2.5-0.5B-Instruct-q4f32_1': {
-            'vram_mb': 1060.20,
-            'parameters': '0.5B',
-            'low_resource_compatible': True,
-            'context_window': 4096,
-            'quantization': 'q4f32_1',
-            'sentiment_f1_score': None,
-            'instruction_following': None,
-            'file_size_gb': 1.06
-        },
-        'Qwen2.5-1.5B-Instruct-q4f32_1': {
-            'vram_mb': 1888.97,
-            'parameters': '1.5B',
-            'low_resource_compatible': True,
-            'context_window': 4096,
-            'quantization': 'q4f32_1',
-            'sentiment_f1_score': 58.29,  # From SentiBench benchmark
-            'instruction_following': None,
-            'file_size_gb': 1.89
-        },
-        'Qwen2.5-3B-Instruct-q4f32_1': {
-            'vram_mb': 2893.64,
-            'parameters': '3B',
-            'low_resource_compatible': True,
-            'context_window': 4096,
-            'quantization': 'q4f32_1',
-            'sentiment_f1_score': None,
-            'instruction_following': None,
-            'file_size_gb': 2.89
-        },
-        'gemma-2-2b-it-q4f32_1': {
-            'vram_mb': 2508.75,
-            'parameters': '2.6B',
-            'low_resource_compatible': False,
-            'context_window': 4096,
-            'quantization': 'q4f32_1',
-            'sentiment_f1_score': 62.62,  # From SentiBench benchmark
-            'instruction_following': None,
-            'file_size_gb': 2.51
-        },
-        'gemma-2-2b-it-q4f32_1-1k': {
-            'vram_mb': 1884.75,
-            'parameters': '2.6B',
-            'low_resource_compatible': True,
-            'context_window': 1024,
-            'quantization': 'q4f32_1',
-            'sentiment_f1_score': 62.62,
-            'instruction_following': None,
-            'file_size_gb': 1.88
-        },
-        'TinyLlama-1.1B-Chat-v1.0-q4f32_1': {
-            'vram_mb': 839.98,
-            'parameters': '1.1B',
-            'low_resource_compatible': True,
-            'context_window': 2048,
-            'quantization': 'q4f32_1',
-            'sentiment_f1_score': 45.18,  # From SentiBench benchmark
-            'instruction_following': None,
-            'file_size_gb': 0.84
-        }
+    _MPL_READY = True
+
+# WebLLM supported models with memory requirements
+_WEBLLM_MODELS = {
+    'Llama-3.2-1B-Instruct-q4f16_1': {
+        'vram_mb': 879.04,
+        'parameters': '1.23B',
+        'low_resource_compatible': True,
+        'context_window': 4096,
+        'quantization': 'q4f16_1',
+        'sentiment_f1_score': None,  # Not directly tested
+        'instruction_following': 59.5,  # IFEval from Llama data
+        'file_size_gb': 0.88
+    },
+    'Llama-3.2-1B-Instruct-q4f32_1': {
+        'vram_mb': 1128.82,
+        'parameters': '1.23B',
+        'low_resource_compatible': True,
+        'context_window': 4096,
+        'quantization': 'q4f32_1',
+        'sentiment_f1_score': None,
+        'instruction_following': 59.5,
+        'file_size_gb': 1.13
+    },
+    'Llama-3.2-3B-Instruct-q4f16_1': {
+        'vram_mb': 2263.69,
+        'parameters': '3.21B',
+        'low_resource_compatible': True,
+        'context_window': 4096,
+        'quantization': 'q4f16_1',
+        'sentiment_f1_score': None,
+        'instruction_following': 59.5,  # Estimated similar to 1B
+        'file_size_gb': 2.26
+    },
+    'SmolLM2-135M-Instruct-q0f32': {
+        'vram_mb': 719.38,
+        'parameters': '135M',
+        'low_resource_compatible': True,
+        'context_window': 4096,
+        'quantization': 'q0f32',
+        'sentiment_f1_score': None,  # Not tested in benchmarks
+        'instruction_following': None,
+        'file_size_gb': 0.72
+    },
+    'SmolLM2-360M-Instruct-q4f32_1': {
+        'vram_mb': 579.61,
+        'parameters': '360M',
+        'low_resource_compatible': True,
+        'context_window': 4096,
+        'quantization': 'q4f32_1',
+        'sentiment_f1_score': None,
+        'instruction_following': None,
+        'file_size_gb': 0.58
+    },
+    'SmolLM2-1.7B-Instruct-q4f32_1': {
+        'vram_mb': 2692.38,
+        'parameters': '1.7B',
+        'low_resource_compatible': True,
+        'context_window': 4096,
+        'quantization': 'q4f32_1',
+        'sentiment_f1_score': None,
+        'instruction_following': None,
+        'file_size_gb': 2.69
+    },
+    'Phi-3.5-mini-instruct-q4f16_1': {
+        'vram_mb': 3672.07,
+        'parameters': '3.8B',
+        'low_resource_compatible': False,
+        'context_window': 4096,
+        'quantization': 'q4f16_1',
+        'sentiment_f1_score': None,
+        'instruction_following': 61.4,  # Overall average from benchmarks
+        'file_size_gb': 3.67
+    },
+    'Phi-3.5-mini-instruct-q4f16_1-1k': {
+        'vram_mb': 2520.07,
+        'parameters': '3.8B',
+        'low_resource_compatible': True,
+        'context_window': 1024,
+        'quantization': 'q4f16_1',
+        'sentiment_f1_score': None,
+        'instruction_following': 61.4,
+        'file_size_gb': 2.52
+    },
+    'Qwen2.5-0.5B-Instruct-q4f32_1': {
+        'vram_mb': 1060.20,
+        'parameters': '0.5B',
+        'low_resource_compatible': True,
+        'context_window': 4096,
+        'quantization': 'q4f32_1',
+        'sentiment_f1_score': None,
+        'instruction_following': None,
+        'file_size_gb': 1.06
+    },
+    'Qwen2.5-1.5B-Instruct-q4f32_1': {
+        'vram_mb': 1888.97,
+        'parameters': '1.5B',
+        'low_resource_compatible': True,
+        'context_window': 4096,
+        'quantization': 'q4f32_1',
+        'sentiment_f1_score': 58.29,  # From SentiBench benchmark
+        'instruction_following': None,
+        'file_size_gb': 1.89
+    },
+    'Qwen2.5-3B-Instruct-q4f32_1': {
+        'vram_mb': 2893.64,
+        'parameters': '3B',
+        'low_resource_compatible': True,
+        'context_window': 4096,
+        'quantization': 'q4f32_1',
+        'sentiment_f1_score': None,
+        'instruction_following': None,
+        'file_size_gb': 2.89
+    },
+    'gemma-2-2b-it-q4f32_1': {
+        'vram_mb': 2508.75,
+        'parameters': '2.6B',
+        'low_resource_compatible': False,
+        'context_window': 4096,
+        'quantization': 'q4f32_1',
+        'sentiment_f1_score': 62.62,  # From SentiBench benchmark
+        'instruction_following': None,
+        'file_size_gb': 2.51
+    },
+    'gemma-2-2b-it-q4f32_1-1k': {
+        'vram_mb': 1884.75,
+        'parameters': '2.6B',
+        'low_resource_compatible': True,
+        'context_window': 1024,
+        'quantization': 'q4f32_1',
+        'sentiment_f1_score': 62.62,
+        'instruction_following': None,
+        'file_size_gb': 1.88
+    },
+    'TinyLlama-1.1B-Chat-v1.0-q4f32_1': {
+        'vram_mb': 839.98,
+        'parameters': '1.1B',
+        'low_resource_compatible': True,
+        'context_window': 2048,
+        'quantization': 'q4f32_1',
+        'sentiment_f1_score': 45.18,  # From SentiBench benchmark
+        'instruction_following': None,
+        'file_size_gb': 0.84
     }
-    
-    # Additional sentiment analysis performance data from research
-    sentiment_performance = {
-        'TinyLlama-1.1B': {
-            'avg_f1': 45.18,
-            'emotional_intelligence_rating': 8.0,  # From comparison study
-            'text_summarization_rating': 8.0,
-            'strengths': ['Small size', 'Fast inference'],
-            'weaknesses': ['Lower accuracy', 'Limited context understanding']
-        },
-        'Qwen2.5-1.5B': {
-            'avg_f1': 58.29,
-            'emotional_intelligence_rating': 9.0,
-            'text_summarization_rating': 0.0,  # Failed due to context length
-            'strengths': ['Good accuracy', 'Structured output', 'Multilingual'],
-            'weaknesses': ['Context limitations in some variants']
-        },
-        'Gemma-2-2.6B': {
-            'avg_f1': 62.62,
-            'emotional_intelligence_rating': None,
-            'text_summarization_rating': None,
-            'strengths': ['High accuracy', 'Good reasoning'],
-            'weaknesses': ['Larger size', 'More memory required']
-        },
-        'Phi-2-2.7B': {
-            'avg_f1': 52.13,
-            'emotional_intelligence_rating': None,
-            'text_summarization_rating': None,
-            'strengths': ['Good coding abilities', 'Reasoning'],
-            'weaknesses': ['Medium accuracy on sentiment']
-        }
+}
+
+# Additional sentiment analysis performance data from research
+_SENTIMENT_PERF = {
+    'TinyLlama-1.1B': {
+        'avg_f1': 45.18,
+        'emotional_intelligence_rating': 8.0,  # From comparison study
+        'text_summarization_rating': 8.0,
+        'strengths': ['Small size', 'Fast inference'],
+        'weaknesses': ['Lower accuracy', 'Limited context understanding']
+    },
+    'Qwen2.5-1.5B': {
+        'avg_f1': 58.29,
+        'emotional_intelligence_rating': 9.0,
+        'text_summarization_rating': 0.0,  # Failed due to context length
+        'strengths': ['Good accuracy', 'Structured output', 'Multilingual'],
+        'weaknesses': ['Context limitations in some variants']
+    },
+    'Gemma-2-2.6B': {
+        'avg_f1': 62.62,
+        'emotional_intelligence_rating': None,
+        'text_summarization_rating': None,
+        'strengths': ['High accuracy', 'Good reasoning'],
+        'weaknesses': ['Larger size', 'More memory required']
+    },
+    'Phi-2-2.7B': {
+        'avg_f1': 52.13,
+        'emotional_intelligence_rating': None,
+        'text_summarization_rating': None,
+        'strengths': ['Good coding abilities', 'Reasoning'],
+        'weaknesses': ['Medium accuracy on sentiment']
     }
-    
-    return webllm_models, sentiment_performance
+}
+
+# Model name parts: family ('Qwen2.5'), base name without the -Instruct/-q4 suffix
+# ('Qwen2.5-1.5B'), and deployment name with only the -Instruct suffix removed
+_NAME_RE = re.compile(r'^(?P<deploy_name>(?P<base_name>(?P<family>[^-]+).*?)(?:-q4.*?)?)(?:-Instruct.*)?$')
+
+def _build_df():
+    """Build the model table as a DataFrame indexed by model name, with derived chart columns"""
+    df = pd.DataFrame.from_dict(_WEBLLM_MODELS, orient='index')
+    df['param_b'] = pd.to_numeric(df['parameters'].str.rstrip('BM'), errors='coerce').mask(
+        df['parameters'].str.endswith('M'), lambda s: s / 1000)  # Convert M to B
+    df = df.join(df.index.to_series().str.extract(_NAME_RE))
+    df['under_4gb'] = df['file_size_gb'] < 4.0
+    df['color'] = np.where(df['low_resource_compatible'], 'green', 'red')
+    return df
+
+# Shared frame of the model table
+_WEBLLM_DF = _build_df()
+
+FEASIBILITY_CATEGORIES = ['Excellent for Journaling', 'Good for Journaling', 'Adequate for Journaling', 'Not Suitable']
 
-def create_memory_vs_performance_chart():
+@lru_cache(maxsize=1)
+def create_webllm_compatibility_data():
+    """Return read-only views of the model compatibility and performance data"""
+    return MappingProxyType(_WEBLLM_MODELS), MappingProxyType(_SENTIMENT_PERF)
+
+def create_memory_vs_performance_chart(df=None):
     """Create scatter plot showing memory requirements vs sentiment performance"""
-    webllm_models, sentiment_perf = create_webllm_compatibility_data()
+    df = _WEBLLM_DF if df is None else df
     
     # Prepare data for plotting
-    models = []
-    memory_mb = []
-    sentiment_scores = []
-    sizes = []
-    colors = []
-    
-    for model_name, data in webllm_models.items():
-        if data['sentiment_f1_score'] is not None:
-            models.append(model_name.split('-')[0] + '\n' + data['parameters'])
-            memory_mb.append(data['vram_mb'])
-            sentiment_scores.append(data['sentiment_f1_score'])
-            
-            # Size based on parameters (for bubble chart effect)
-            param_val = float(data['parameters'].replace('B', '').replace('M', ''))
-            if 'M' in data['parameters']:
-                param_val = param_val / 1000  # Convert to B
-            sizes.append(param_val * 100)
-            
-            # Color based on low resource compatibility
-            colors.append('green' if data['low_resource_compatible'] else 'red')
-    
-    plt.figure(figsize=(12, 8))
-    scatter = plt.scatter(memory_mb, sentiment_scores, s=sizes, c=colors, alpha=0.6, edgecolors='black')
-    
-    # Add model labels
-    for i, model in enumerate(models):
-        plt.annotate(model, (memory_mb[i], sentiment_scores[i]), 
-                    xytext=(5, 5), textcoords='offset points', fontsize=9)
-    
-    plt.xlabel('VRAM Requirements (MB)', fontsize=12)
-    plt.ylabel('Sentiment Analysis F1-Score (%)', fontsize=12)
-    plt.title('WebLLM Models: Memory vs Sentiment Analysis Performance\n(Bubble size = Model parameters, Green = Low-resource compatible)', fontsize=14)
-    plt.grid(True, alpha=0.3)
+    sub = df[df['sentiment_f1_score'].notna()]
+    models = list(sub['family'] + '\n' + sub['parameters'])
+    memory_mb = sub['vram_mb'].to_numpy()
+    sentiment_scores = sub['sentiment_f1_score'].to_numpy()
+    sizes = sub['param_b'].to_numpy() * 100  # Size based on parameters (for bubble chart effect)
+    colors = sub['color'].to_numpy()  # Color based on low resource compatibility
+    
+    fig, ax = plt.subplots(figsize=(12, 8))
+    scatter = ax.scatter(memory_mb, sentiment_scores, s=sizes, c=colors, alpha=0.6, edgecolors='black')
+    
+    # Add model labels, sharing one 5pt-offset transform across all labels
+    label_transform = offset_copy(ax.transData, fig=fig, x=5, y=5, units='points')
+    for x, y, model in zip(memory_mb, sentiment_scores, models):
+        ax.text(x, y, model, transform=label_transform, fontsize=9)
+    
+    ax.set_xlabel('VRAM Requirements (MB)', fontsize=12)
+    ax.set_ylabel('Sentiment Analysis F1-Score (%)', fontsize=12)
+    ax.set_title('WebLLM Models: Memory vs Sentiment Analysis Performance\n(Bubble size = Model parameters, Green = Low-resource compatible)', fontsize=14)
+    ax.grid(True, alpha=0.3)
     
     # Add 4GB memory constraint line
-    plt.axvline(x=4000, color='orange', linestyle='--', linewidth=2, label='4GB Memory Limit')
-    plt.legend(['Low-resource Compatible', 'High-resource Required', '4GB Memory Limit'])
+    ax.axvline(x=4000, color='orange', linestyle='--', linewidth=2, label='4GB Memory Limit')
+    ax.legend(['Low-resource Compatible', 'High-resource Required', '4GB Memory Limit'])
     
-    plt.tight_layout()
-    plt.savefig('/workspace/charts/memory_vs_sentiment_performance.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.tight_layout()
+    fig.savefig('/workspace/charts/memory_vs_sentiment_performance.png', dpi=150)
+    plt.close(fig)
 
-def create_model_comparison_matrix():
+def create_model_comparison_matrix(df=None):
     """Create comprehensive comparison matrix of all models"""
-    webllm_models, sentiment_perf = create_webllm_compatibility_data()
+    src = _WEBLLM_DF if df is None else df
     
     # Create comparison data
-    comparison_data = []
-    
-    for model_name, data in webllm_models.items():
-        base_name = model_name.split('-Instruct')[0].split('-q4')[0]
-        
-        comparison_data.append({
-            'Model': base_name,
-            'Parameters': data['parameters'],
-            'VRAM (MB)': data['vram_mb'],
-            'File Size (GB)': data['file_size_gb'],
-            'Context Length': data['context_window'],
-            'Quantization': data['quantization'],
-            'Low Resource': 'Yes' if data['low_resource_compatible'] else 'No',
-            'Sentiment F1': data['sentiment_f1_score'] if data['sentiment_f1_score'] else 'N/A',
-            'Instruction Following': data['instruction_following'] if data['instruction_following'] else 'N/A',
-            'Under 4GB': 'Yes' if data['file_size_gb'] < 4.0 else 'No'
-        })
-    
-    df = pd.DataFrame(comparison_data)
+    df = pd.DataFrame({
+        'Model': src['base_name'],
+        'Parameters': src['parameters'],
+        'VRAM (MB)': src['vram_mb'],
+        'File Size (GB)': src['file_size_gb'],
+        'Context Length': src['context_window'],
+        'Quantization': src['quantization'],
+        'Low Resource': np.where(src['low_resource_compatible'], 'Yes', 'No'),
+        'Sentiment F1': src['sentiment_f1_score'],
+        'Instruction Following': src['instruction_following'],
+        'Under 4GB': np.where(src['under_4gb'], 'Yes', 'No')
+    }).reset_index(drop=True)
     
     # Create heatmap for numeric columns
     numeric_cols = ['VRAM (MB)', 'File Size (GB)', 'Context Length']
-    sentiment_cols = []
-    
-    # Add sentiment scores where available
-    for idx, row in df.iterrows():
-        if row['Sentiment F1'] != 'N/A':
-            sentiment_cols.append(float(row['Sentiment F1']))
-        else:
-            sentiment_cols.append(np.nan)
     
-    df['Sentiment Score'] = sentiment_cols
+    # Missing scores stay NaN; 'N/A' is only applied when writing the CSV
+    df['Sentiment Score'] = df['Sentiment F1']
     
     # Create visualization
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(20, 10))
@@ -306,13 +327,10 @@ def create_model_comparison_matrix():
     heatmap_data.index = df['Model']
     
     # Normalize data for heatmap (0-1 scale)
-    heatmap_normalized = heatmap_data.copy()
-    for col in heatmap_normalized.columns:
-        col_data = heatmap_normalized[col].dropna()
-        if len(col_data) > 0:
-            min_val, max_val = col_data.min(), col_data.max()
-            if max_val > min_val:
-                heatmap_normalized[col] = (heatmap_normalized[col] - min_val) / (max_val - min_val)
+    arr = heatmap_data.to_numpy(dtype=np.float64)
+    min_val, max_val = np.nanmin(arr, axis=0), np.nanmax(arr, axis=0)
+    val_range = np.where(max_val > min_val, max_val - min_val, 1.0)
+    heatmap_normalized = pd.DataFrame((arr - min_val) / val_range, index=heatmap_data.index, columns=heatmap_data.columns)
     
     sns.heatmap(heatmap_normalized, annot=heatmap_data, fmt='.1f', cmap='RdYlGn_r', 
                 ax=ax1, cbar_kws={'label': 'Normalized Score (0-1)'})
@@ -335,64 +353,58 @@ def create_model_comparison_matrix():
     for i, bar in enumerate(bars):
         height = bar.get_height()
         ax2.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                f'{height:.1f}', ha='center', va='bottom')
+                f'{height:.1f}' if pd.notna(height) else 'N/A', ha='center', va='bottom')
     
-    plt.tight_layout()
-    plt.savefig('/workspace/charts/model_comparison_matrix.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.tight_layout()
+    fig.savefig('/workspace/charts/model_comparison_matrix.png', dpi=150)
+    plt.close(fig)
     
     return df
 
-def create_deployment_feasibility_chart():
+@njit(cache=True)
+def _feasibility_scores(file_gb, low_res, sent_f1, ctx):
+    """Score each model for journaling deployment from parallel NumPy arrays"""
+    out = np.empty(file_gb.size, np.int32)
+    for i in range(file_gb.size):
+        s = 0
+        if file_gb[i] < 4.0:
+            s += 2
+        elif file_gb[i] < 6.0:
+            s += 1
+        if low_res[i]:
+            s += 2
+        f = sent_f1[i]
+        if f == f:  # not NaN
+            if f > 60:
+                s += 3
+            elif f > 50:
+                s += 2
+            elif f > 40:
+                s += 1
+        if ctx[i] >= 4096:
+            s += 1
+        out[i] = s
+    return out
+
+def create_deployment_feasibility_chart(df=None):
     """Create chart showing deployment feasibility based on constraints"""
-    webllm_models, _ = create_webllm_compatibility_data()
+    df = _WEBLLM_DF if df is None else df
+    
+    # Scoring criteria:
+    # - File size under 4GB
+    # - Low resource compatible
+    # - Good sentiment performance (if available)
+    # - Adequate context length
+    score = _feasibility_scores(
+        df['file_size_gb'].to_numpy(np.float64),
+        df['low_resource_compatible'].to_numpy(np.bool_),
+        df['sentiment_f1_score'].to_numpy(np.float64),
+        df['context_window'].to_numpy(np.int64),
+    )
     
     # Categorize models by deployment feasibility
-    categories = {
-        'Excellent for Journaling': [],
-        'Good for Journaling': [],
-        'Adequate for Journaling': [],
-        'Not Suitable': []
-    }
-    
-    for model_name, data in webllm_models.items():
-        # Scoring criteria:
-        # - File size under 4GB
-        # - Low resource compatible
-        # - Good sentiment performance (if available)
-        # - Adequate context length
-        
-        score = 0
-        
-        if data['file_size_gb'] < 4.0:
-            score += 2
-        elif data['file_size_gb'] < 6.0:
-            score += 1
-            
-        if data['low_resource_compatible']:
-            score += 2
-            
-        if data['sentiment_f1_score'] and data['sentiment_f1_score'] > 60:
-            score += 3
-        elif data['sentiment_f1_score'] and data['sentiment_f1_score'] > 50:
-            score += 2
-        elif data['sentiment_f1_score'] and data['sentiment_f1_score'] > 40:
-            score += 1
-            
-        if data['context_window'] >= 4096:
-            score += 1
-            
-        # Categorize based on score
-        base_name = model_name.split('-Instruct')[0]
-        
-        if score >= 7:
-            categories['Excellent for Journaling'].append(base_name)
-        elif score >= 5:
-            categories['Good for Journaling'].append(base_name)
-        elif score >= 3:
-            categories['Adequate for Journaling'].append(base_name)
-        else:
-            categories['Not Suitable'].append(base_name)
+    category = np.select([score >= 7, score >= 5, score >= 3], FEASIBILITY_CATEGORIES[:3], default=FEASIBILITY_CATEGORIES[3])
+    categories = {name: list(df['deploy_name'][category == name]) for name in FEASIBILITY_CATEGORIES}
     
     # Create visualization
     fig, ax = plt.subplots(figsize=(14, 8))
@@ -418,28 +430,24 @@ def create_deployment_feasibility_chart():
     ax.set_yticklabels(categories.keys())
     ax.legend(loc='upper right')
     
-    plt.tight_layout()
-    plt.savefig('/workspace/charts/deployment_feasibility.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.tight_layout()
+    fig.savefig('/workspace/charts/deployment_feasibility.png', dpi=150)
+    plt.close(fig)
 
-def generate_analysis_summary():
+def generate_analysis_summary(df=None):
     """Generate text summary of analysis findings"""
-    webllm_models, sentiment_perf = create_webllm_compatibility_data()
+    df = _WEBLLM_DF if df is None else df
+    best_sentiment = df['sentiment_f1_score'].idxmax()
+    smallest = df['file_size_gb'].idxmin()
     
     # Key findings
     findings = {
-        'total_models_analyzed': len(webllm_models),
-        'models_with_sentiment_data': len([m for m in webllm_models.values() if m['sentiment_f1_score']]),
-        'models_under_4gb': len([m for m in webllm_models.values() if m['file_size_gb'] < 4.0]),
-        'low_resource_compatible': len([m for m in webllm_models.values() if m['low_resource_compatible']]),
-        'best_sentiment_model': max(
-            [(name, data['sentiment_f1_score']) for name, data in webllm_models.items() if data['sentiment_f1_score']], 
-            key=lambda x: x[1]
-        ),
-        'smallest_model': min(
-            [(name, data['file_size_gb']) for name, data in webllm_models.items()], 
-            key=lambda x: x[1]
-        )
+        'total_models_analyzed': len(df),
+        'models_with_sentiment_data': int(df['sentiment_f1_score'].notna().sum()),
+        'models_under_4gb': int(df['under_4gb'].sum()),
+        'low_resource_compatible': int(df['low_resource_compatible'].sum()),
+        'best_sentiment_model': (best_sentiment, float(df.at[best_sentiment, 'sentiment_f1_score'])),
+        'smallest_model': (smallest, float(df.at[smallest, 'file_size_gb']))
     }
     
     summary = f"""
@@ -464,31 +472,63 @@ Key Insights:
     
     return summary, findings
 
+OUTPUT_FILES = [
+    '/workspace/charts/memory_vs_sentiment_performance.png',
+    '/workspace/charts/model_comparison_matrix.png',
+    '/workspace/charts/deployment_feasibility.png',
+    '/workspace/data/model_comparison_matrix.csv',
+    '/workspace/data/analysis_summary.txt',
+    '/workspace/data/analysis_findings.json',
+]
+OUTPUT_DIRS = [Path('/workspace/charts'), Path('/workspace/data')]
+CACHE_KEY_FILE = Path('/workspace/data/.cache_key')
+
+def compute_cache_key():
+    """Hash the model data and this script so outputs are regenerated when either changes"""
+    digest = hashlib.sha256(repr((_WEBLLM_MODELS, _SENTIMENT_PERF)).encode())
+    digest.update(Path(__file__).read_bytes())
+    return digest.hexdigest()
+
 def main():
     """Run complete analysis pipeline"""
+    # Skip the pipeline if all outputs were generated from the same inputs
+    cache_key = compute_cache_key()
+    if (CACHE_KEY_FILE.exists() and CACHE_KEY_FILE.read_text() == cache_key
+            and all(Path(f).exists() for f in OUTPUT_FILES)):
+        print("Analysis outputs are up-to-date, skipping regeneration")
+        return Path('/workspace/data/analysis_summary.txt').read_text(), pd.read_csv('/workspace/data/model_comparison_matrix.csv')
+    
     print("Setting up analysis environment...")
+    setup_matplotlib_for_plotting()
     
-    # Create charts directory
-    Path('/workspace/charts').mkdir(exist_ok=True)
+    # Create output directories
+    for output_dir in OUTPUT_DIRS:
+        output_dir.mkdir(parents=True, exist_ok=True)
     
     print("Creating visualizations...")
     
-    # Generate all charts
-    create_memory_vs_performance_chart()
-    print("✓ Memory vs Performance chart created")
-    
-    comparison_df = create_model_comparison_matrix()
-    print("✓ Model comparison matrix created")
-    
-    create_deployment_feasibility_chart()
-    print("✓ Deployment feasibility chart created")
+    # Generate all charts in parallel (each is independent and CPU-bound)
+    df = _WEBLLM_DF
+    with ProcessPoolExecutor(max_workers=3, initializer=setup_matplotlib_for_plotting) as executor:
+        memory_future = executor.submit(create_memory_vs_performance_chart, df)
+        comparison_future = executor.submit(create_model_comparison_matrix, df)
+        feasibility_future = executor.submit(create_deployment_feasibility_chart, df)
+        
+        memory_future.result()
+        print("✓ Memory vs Performance chart created")
+        
+        comparison_df = comparison_future.result()
+        print("✓ Model comparison matrix created")
+        
+        feasibility_future.result()
+        print("✓ Deployment feasibility chart created")
     
     # Generate summary
-    summary, findings = generate_analysis_summary()
+    summary, findings = generate_analysis_summary(df)
     print("✓ Analysis summary generated")
     
     # Save comparison matrix as CSV
-    comparison_df.to_csv('/workspace/data/model_comparison_matrix.csv', index=False)
+    comparison_df.to_csv('/workspace/data/model_comparison_matrix.csv', index=False, na_rep='N/A', lineterminator='\n')
     print("✓ Comparison matrix saved to CSV")
     
     # Save analysis summary
@@ -496,16 +536,18 @@ def main():
         f.write(summary)
     
     # Save findings as JSON
-    with open('/workspace/data/analysis_findings.json', 'w') as f:
-        json.dump(findings, f, indent=2)
+    if orjson is not None:
+        findings_json = orjson.dumps(findings, option=orjson.OPT_INDENT_2)
+    else:
+        findings_json = json.dumps(findings, indent=2).encode()
+    Path('/workspace/data/analysis_findings.json').write_bytes(findings_json)
+    
+    # Record the inputs these outputs were generated from
+    CACHE_KEY_FILE.write_text(cache_key)
     
     print("\nAnalysis complete! Generated files:")
-    print("- /workspace/charts/memory_vs_sentiment_performance.png")
-    print("- /workspace/charts/model_comparison_matrix.png") 
-    print("- /workspace/charts/deployment_feasibility.png")
-    print("- /workspace/data/model_comparison_matrix.csv")
-    print("- /workspace/data/analysis_summary.txt")
-    print("- /workspace/data/analysis_findings.json")
+    for f in OUTPUT_FILES:
+        print(f"- {f}")
     
     return summary, comparison_df
 